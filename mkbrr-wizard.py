@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import errno
 import json
 import os
 import re
@@ -28,8 +29,10 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -39,6 +42,11 @@ except ImportError as e:
     print("❌ PyYAML is not installed. Install it with:\n   pip install pyyaml")
     raise SystemExit(1) from e
 
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader  # libyaml: ~5-10x faster parse
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 try:
     from rich import box
     from rich.console import Console, Group
@@ -133,13 +141,34 @@ def _expand_env(s: str) -> str:
     return os.path.expandvars(s)
 
 
+# Home directory resolved once at import; expanduser re-reads HOME (or
+# getpwuid) on every call otherwise, and bare ~/... is by far the common case.
+_HOME = os.path.expanduser("~")
+
+
+@lru_cache(maxsize=256)
+def _expand_tilde_path(p: str) -> str:
+    if p == "~":
+        return _HOME
+    if p.startswith("~/"):
+        return str(Path(_HOME + p[1:]))
+    return str(Path(p).expanduser())
+
+
 def _expand_path(p: str) -> str:
-    """Expand ~ and $VARS and return a normalized path string (doesn't require existence)."""
+    """Expand ~ and $VARS and return a normalized path string (doesn't require existence).
+
+    Results for env-free inputs are memoized; the same path strings come
+    through repeatedly (config load, every interactive prompt), and
+    expansion is deterministic for them.  Inputs containing ``$`` are
+    expanded fresh each call since the environment can change.
+    """
     p = (p or "").strip()
     if not p:
         return p
-    p = os.path.expandvars(p)
-    return str(Path(p).expanduser())
+    if "$" in p:
+        return str(Path(os.path.expandvars(p)).expanduser())
+    return _expand_tilde_path(p)
 
 
 def _clean_user_path(s: str) -> str:
@@ -159,7 +188,7 @@ def _clean_user_path(s: str) -> str:
     return _expand_path(s)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathsCfg:
     host_data_root: str
     container_data_root: str
@@ -169,25 +198,25 @@ class PathsCfg:
     container_config_dir: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OwnershipCfg:
     uid: int
     gid: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MkbrrCfg:
     binary: str
     image: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatchCfg:
     mode: str  # simple|advanced
     job_timeout_seconds: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnraidCfg:
     enabled: bool = False
     fuse_root: str = "/mnt/user"
@@ -198,14 +227,14 @@ class UnraidCfg:
     split_share_follow_symlinks: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkersCfg:
     hdd: int | None = 1  # --workers value for spinning disks (None = auto)
     ssd: int | None = None  # --workers value for SSDs/NVMe (None = auto)
     default: int | None = None  # fallback when storage type can't be determined
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PushoverCfg:
     enabled: bool = False
     app_token: str = ""
@@ -215,7 +244,7 @@ class PushoverCfg:
     device: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscordCfg:
     enabled: bool = False
     webhook_url: str = ""
@@ -226,7 +255,7 @@ class DiscordCfg:
     color_partial: int = 0xF39C12
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationsCfg:
     enabled: bool = False
     policy: str = "summary"  # summary|failures_only|off
@@ -235,7 +264,7 @@ class NotificationsCfg:
     timeout_seconds: int = 10
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppCfg:
     runtime: str  # auto|docker|native
     docker_support: bool
@@ -257,7 +286,7 @@ class AppCfg:
 def load_config(path: Path) -> AppCfg:
     raw: dict[str, Any] = {}
     if path.exists():
-        loaded = yaml.safe_load(path.read_text(encoding="utf-8"))
+        loaded = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlSafeLoader)
         if loaded is None:
             raw = {}
         elif not isinstance(loaded, dict):
@@ -461,7 +490,8 @@ def load_config(path: Path) -> AppCfg:
 # ----------------------------
 
 
-def docker_available() -> bool:
+def _probe_docker() -> bool:
+    """One uncached ``docker --version`` probe; split out for testability."""
     try:
         r = subprocess.run(["docker", "--version"], capture_output=True, text=True, check=False)
         return r.returncode == 0
@@ -469,8 +499,25 @@ def docker_available() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def docker_available() -> bool:
+    """Whether the docker CLI responds; probed once per process.
+
+    Spawning ``docker --version`` costs tens of milliseconds, so the result
+    is cached — docker does not appear or vanish mid-session.
+    """
+    return _probe_docker()
+
+
+@lru_cache(maxsize=8)
+def _which_cached(binary: str, path: str | None) -> str | None:
+    return shutil.which(binary, path=path)
+
+
 def native_available(binary: str) -> bool:
-    return shutil.which(binary) is not None
+    # Keyed on PATH as well so the cache stays correct if the environment
+    # changes; repeated lookups of the same binary skip the directory walk.
+    return _which_cached(binary, os.environ.get("PATH")) is not None
 
 
 def pick_runtime(cfg: AppCfg, forced: str | None) -> str:
@@ -493,11 +540,14 @@ def pick_runtime(cfg: AppCfg, forced: str | None) -> str:
     )
 
 
+_RE_SEMVER = re.compile(r"(?<![0-9A-Za-z])[vV]?(\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?)")
+
+
 def detect_mkbrr_version(cfg: AppCfg, runtime: str) -> str:
     """Best-effort mkbrr version string for the active runtime."""
 
     def _shorten_version_line(line: str) -> str:
-        m = re.search(r"(?<![0-9A-Za-z])[vV]?(\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?)", line)
+        m = _RE_SEMVER.search(line)
         if m:
             return m.group(1)
         return line
@@ -549,30 +599,25 @@ def detect_mkbrr_version(cfg: AppCfg, runtime: str) -> str:
 # ----------------------------
 
 
+def _is_under_root(path: str, root: str) -> bool:
+    return path == root or path.startswith(root + "/")
+
+
 def map_content_path(cfg: AppCfg, runtime: str, raw: str) -> str:
     raw = raw.strip()
     if runtime == "docker":
         # host -> container
-        if (
-            raw.startswith(cfg.paths.container_data_root + "/")
-            or raw == cfg.paths.container_data_root
-        ):
+        if _is_under_root(raw, cfg.paths.container_data_root):
             return raw
         abs_path = os.path.abspath(raw)
-        if (
-            abs_path.startswith(cfg.paths.host_data_root + "/")
-            or abs_path == cfg.paths.host_data_root
-        ):
+        if _is_under_root(abs_path, cfg.paths.host_data_root):
             return cfg.paths.container_data_root + abs_path[len(cfg.paths.host_data_root) :]
         return raw
     else:
         # container -> host
-        if raw.startswith(cfg.paths.host_data_root + "/") or raw == cfg.paths.host_data_root:
+        if _is_under_root(raw, cfg.paths.host_data_root):
             return raw
-        if (
-            raw.startswith(cfg.paths.container_data_root + "/")
-            or raw == cfg.paths.container_data_root
-        ):
+        if _is_under_root(raw, cfg.paths.container_data_root):
             return cfg.paths.host_data_root + raw[len(cfg.paths.container_data_root) :]
         return os.path.abspath(raw)
 
@@ -581,33 +626,30 @@ def map_torrent_path(cfg: AppCfg, runtime: str, raw: str) -> str:
     raw = raw.strip()
     if runtime == "docker":
         # host output -> container output
-        if (
-            raw.startswith(cfg.paths.container_output_dir + "/")
-            or raw == cfg.paths.container_output_dir
-        ):
+        if _is_under_root(raw, cfg.paths.container_output_dir):
             return raw
         abs_path = os.path.abspath(raw)
-        if (
-            abs_path.startswith(cfg.paths.host_output_dir + "/")
-            or abs_path == cfg.paths.host_output_dir
-        ):
+        if _is_under_root(abs_path, cfg.paths.host_output_dir):
             return cfg.paths.container_output_dir + abs_path[len(cfg.paths.host_output_dir) :]
         return raw
     else:
         # container output -> host output
-        if raw.startswith(cfg.paths.host_output_dir + "/") or raw == cfg.paths.host_output_dir:
+        if _is_under_root(raw, cfg.paths.host_output_dir):
             return raw
-        if (
-            raw.startswith(cfg.paths.container_output_dir + "/")
-            or raw == cfg.paths.container_output_dir
-        ):
+        if _is_under_root(raw, cfg.paths.container_output_dir):
             return cfg.paths.host_output_dir + raw[len(cfg.paths.container_output_dir) :]
         return os.path.abspath(raw)
 
 
+# Unraid physical mount names: disk1..diskN and cache / cache-<pool>.
+# Compiled once — these run per /mnt entry on every FUSE path resolution.
+_RE_DISK_NAME = re.compile(r"disk(\d+)")
+_RE_CACHE_NAME = re.compile(r"cache(?:-.+)?")
+
+
 def _natural_disk_sort_key(path: str) -> tuple[int, str]:
     name = os.path.basename(path)
-    match = re.fullmatch(r"disk(\d+)", name)
+    match = _RE_DISK_NAME.fullmatch(name)
     if not match:
         return (sys.maxsize, name)
     return (int(match.group(1)), name)
@@ -619,8 +661,8 @@ def _unraid_candidate_roots(cache_first: bool = False) -> list[str]:
     except OSError:
         return []
 
-    disk_roots = [p for p in entries if re.fullmatch(r"disk\d+", os.path.basename(p))]
-    cache_roots = [p for p in entries if re.fullmatch(r"cache(?:-.+)?", os.path.basename(p))]
+    disk_roots = [p for p in entries if _RE_DISK_NAME.fullmatch(os.path.basename(p))]
+    cache_roots = [p for p in entries if _RE_CACHE_NAME.fullmatch(os.path.basename(p))]
     disk_roots.sort(key=_natural_disk_sort_key)
     cache_roots.sort()
     if cache_first:
@@ -632,6 +674,7 @@ def _unraid_candidate_roots(cache_first: bool = False) -> list[str]:
 # Storage type detection (HDD vs SSD)
 # ----------------------------
 
+_RE_UNRAID_MOUNT_ROOT = re.compile(r"^/mnt/(disk\d+|cache(?:-.+)?)(/.*)?$")
 _RE_UNRAID_HDD = re.compile(r"^/mnt/disk\d+(/|$)")
 _RE_UNRAID_SSD = re.compile(r"^/mnt/cache(?:-.+)?(/|$)")
 _RE_UNRAID_FUSE = re.compile(r"^/mnt/user(/|$)")
@@ -822,7 +865,7 @@ def _resolve_unraid_host_data_root(cfg: AppCfg, resolved_host_path: str) -> str
     if "/" not in relative_from_mnt:
         return None
     mount_root_name = relative_from_mnt.split("/", 1)[0]
-    if not re.fullmatch(r"disk\d+|cache(?:-.+)?", mount_root_name):
+    if not (_RE_DISK_NAME.fullmatch(mount_root_name) or _RE_CACHE_NAME.fullmatch(mount_root_name)):
         return None
 
     suffix = host_data_root[len(fuse_root) :]
@@ -887,6 +930,21 @@ def _detect_split_share_mismatch(
         onerror=_onerror,
         followlinks=follow_symlinks,
     ):
+        if not files:
+            continue
+
+        # One scandir of the mirrored directory replaces a per-file
+        # os.path.exists stat against the resolved mount.
+        rel_dir = os.path.relpath(root, original_host_path)
+        target_dir = (
+            resolved_host_path if rel_dir == "." else os.path.join(resolved_host_path, rel_dir)
+        )
+        try:
+            with os.scandir(target_dir) as it:
+                target_names = {e.name for e in it}
+        except OSError:
+            target_names = set()
+
         for filename in files:
             scanned += 1
             if scanned > max_entries:
@@ -894,12 +952,10 @@ def _detect_split_share_mismatch(
                 stop_scan = True
                 break
 
-            source_file = os.path.join(root, filename)
-            rel = os.path.relpath(source_file, original_host_path)
-            target_file = os.path.join(resolved_host_path, rel)
-            if not os.path.exists(target_file):
+            if filename not in target_names:
                 missing_count += 1
                 if len(missing_examples) < 5:
+                    rel = filename if rel_dir == "." else os.path.join(rel_dir, filename)
                     missing_examples.append(rel)
         if stop_scan:
             break
@@ -965,7 +1021,7 @@ def preflight_unraid_split_share(
             if suffix and not suffix.startswith("/"):
                 suffix = f"/{suffix}"
 
-            match = re.match(r"^/mnt/(disk\d+|cache(?:-.+)?)(/.*)?$", resolved_host_path)
+            match = _RE_UNRAID_MOUNT_ROOT.match(resolved_host_path)
             if match and suffix:
                 candidate_root = f"/mnt/{match.group(1)}{suffix}"
                 if resolved_host_path == candidate_root or resolved_host_path.startswith(
@@ -1031,6 +1087,10 @@ _VIDEO_EXTENSIONS = frozenset((".mkv", ".mp4", ".avi", ".ts", ".m2ts"))
 # Matches S01E02, s01e02, S01E01E02 (captures first episode number only)
 _EPISODE_RE = re.compile(r"S(\d{2,})E(\d{2,})", re.IGNORECASE)
 
+# Split-range input: "," or ";" separators, "start-end" tokens
+_RANGE_SEP_RE = re.compile(r"[,;]+")
+_RANGE_TOKEN_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+
 
 def scan_episodes(directory: str) -> list[tuple[int, str]]:
     """Scan *directory* for video files with S##E## names.
@@ -1042,22 +1102,23 @@ def scan_episodes(directory: str) -> list[tuple[int, str]]:
     """
     results: list[tuple[int, str]] = []
     try:
-        entries = os.listdir(directory)
+        with os.scandir(directory) as it:
+            for entry in it:
+                # DirEntry.is_file uses the cached d_type — no per-file stat
+                # like the old listdir + os.path.isfile pairing.
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                ext = os.path.splitext(name)[1].lower()
+                if ext not in _VIDEO_EXTENSIONS:
+                    continue
+                m = _EPISODE_RE.search(name)
+                if m:
+                    ep_num = int(m.group(2))
+                    results.append((ep_num, name))
     except OSError:
         return results
 
-    for name in entries:
-        full = os.path.join(directory, name)
-        if not os.path.isfile(full):
-            continue
-        ext = os.path.splitext(name)[1].lower()
-        if ext not in _VIDEO_EXTENSIONS:
-            continue
-        m = _EPISODE_RE.search(name)
-        if m:
-            ep_num = int(m.group(2))
-            results.append((ep_num, name))
-
     results.sort(key=lambda t: t[0])
     return results
 
@@ -1107,24 +1168,23 @@ def parse_split_ranges(input_str: str, available: list[int]) -> list[list[int]]:
     seen: set[int] = set()
 
     # Normalize separators: "1-11; 12-22" -> "1-11, 12-22"
-    tokens = [t.strip() for t in re.split(r"[,;]+", input_str) if t.strip()]
+    tokens = [t.strip() for t in _RANGE_SEP_RE.split(input_str) if t.strip()]
     if not tokens:
         raise ValueError("No ranges provided")
 
     for token in tokens:
-        m = re.fullmatch(r"(\d+)\s*-\s*(\d+)", token)
+        m = _RANGE_TOKEN_RE.fullmatch(token)
         if not m:
             raise ValueError(f"Invalid range token: '{token}' — expected e.g. '1-11'")
         lo, hi = int(m.group(1)), int(m.group(2))
         if lo > hi:
             raise ValueError(f"Invalid range: {lo}-{hi} (start > end)")
 
-        overlap = seen & set(range(lo, hi + 1))
-        if overlap:
-            raise ValueError(
-                f"Overlapping range: {token} — episode(s) {sorted(overlap)} already assigned"
-            )
-        seen.update(range(lo, hi + 1))
+        span = range(lo, hi + 1)
+        if not seen.isdisjoint(span):
+            overlap = sorted(ep for ep in span if ep in seen)
+            raise ValueError(f"Overlapping range: {token} — episode(s) {overlap} already assigned")
+        seen.update(span)
 
         part_eps = sorted(ep for ep in range(lo, hi + 1) if ep in available_set)
         if not part_eps:
@@ -1379,6 +1439,37 @@ def build_check_command(
     return cmd
 
 
+@lru_cache(maxsize=32)
+def _docker_base_tail(
+    docker_user: str | None,
+    workdir: str,
+    data_root: str,
+    paths: PathsCfg,
+    image: str,
+) -> tuple[str, ...]:
+    """Cacheable (config-derived) tail of the docker run command.
+
+    Everything past --rm/-it is fixed for a given config + workdir +
+    data root, so build the mount/image arguments once per combination.
+    """
+    tail: list[str] = []
+    if docker_user:
+        tail += ["--user", docker_user]
+    tail += [
+        "-w",
+        workdir,
+        "-v",
+        f"{data_root}:{paths.container_data_root}",
+        "-v",
+        f"{paths.host_output_dir}:{paths.container_output_dir}",
+        "-v",
+        f"{paths.host_config_dir}:{paths.container_config_dir}",
+        image,
+        "mkbrr",
+    ]
+    return tuple(tail)
+
+
 def docker_run_base(
     cfg: AppCfg, workdir: str, host_data_root_override: str | None = None
 ) -> list[str]:
@@ -1388,23 +1479,8 @@ def docker_run_base(
     if sys.stdin.isatty():
         cmd += ["-it"]
 
-    if cfg.docker_user:
-        cmd += ["--user", cfg.docker_user]
-
     data_root = host_data_root_override or cfg.paths.host_data_root
-
-    cmd += [
-        "-w",
-        workdir,
-        "-v",
-        f"{data_root}:{cfg.paths.container_data_root}",
-        "-v",
-        f"{cfg.paths.host_output_dir}:{cfg.paths.container_output_dir}",
-        "-v",
-        f"{cfg.paths.host_config_dir}:{cfg.paths.container_config_dir}",
-        cfg.mkbrr.image,
-        "mkbrr",
-    ]
+    cmd += _docker_base_tail(cfg.docker_user, workdir, data_root, cfg.paths, cfg.mkbrr.image)
     return cmd
 
 
@@ -1413,7 +1489,52 @@ def docker_run_base(
 # ----------------------------
 
 
+def _scan_torrent_entries(root: str) -> list[os.DirEntry[str]]:
+    """Collect DirEntry objects for .torrent files under *root* (recursive)."""
+    entries: list[os.DirEntry[str]] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(".torrent"):
+                        entries.append(entry)
+        except OSError:
+            continue
+    return entries
+
+
+def _chown_if_mismatched(entry: os.DirEntry[str], uid: int, gid: int) -> tuple[bool, str | None]:
+    """Chown *entry* to uid:gid when needed.
+
+    Uses the DirEntry's cached stat result (no extra path resolution).
+    Returns ``(changed, warning)`` so callers can aggregate results without
+    printing from worker threads.
+    """
+    try:
+        st = entry.stat(follow_symlinks=False)
+        if st.st_uid != uid or st.st_gid != gid:
+            # follow_symlinks=False keeps the mutation on the same inode the
+            # check above inspected — chown the link itself, not its target.
+            os.chown(entry.path, uid, gid, follow_symlinks=False)
+            return True, None
+    except FileNotFoundError:
+        pass
+    except PermissionError as e:
+        return False, f"Permission error on {entry.path}: {e}"
+    return False, None
+
+
 def maybe_fix_torrent_permissions(cfg: AppCfg) -> None:
+    """Chown .torrent files under the output dir to the configured uid:gid.
+
+    Short-circuits without walking the tree when the output dir's filesystem
+    does not support chown (e.g. FAT, SMB without idmap) — probed via a no-op
+    chown on the root.
+    """
     if not cfg.chown:
         return
 
@@ -1427,23 +1548,41 @@ def maybe_fix_torrent_permissions(cfg: AppCfg) -> None:
         console.print("[warn]⚠ chown=true but not running as root; skipping chown.[/]")
         return
 
+    # Probe chown support with a no-op chown on the root before walking the
+    # whole tree — some filesystems silently lack chown support.
+    try:
+        root_st = os.stat(outdir)
+        os.chown(outdir, root_st.st_uid, root_st.st_gid)
+    except PermissionError:
+        console.print(f"[warn]⚠ Filesystem does not support chown; skipping: {outdir}[/]")
+        return
+    except OSError as e:
+        if e.errno in (errno.ENOTSUP, errno.EROFS):
+            console.print(f"[warn]⚠ Filesystem does not support chown; skipping: {outdir}[/]")
+            return
+        raise
+
     uid, gid = cfg.ownership.uid, cfg.ownership.gid
-    changed = 0
 
-    for dirpath, _, files in os.walk(outdir):
-        for f in files:
-            if not f.lower().endswith(".torrent"):
-                continue
-            p = os.path.join(dirpath, f)
-            try:
-                st = os.stat(p)
-                if st.st_uid != uid or st.st_gid != gid:
-                    os.chown(p, uid, gid)
+    candidates = _scan_torrent_entries(outdir)
+
+    # stat/chown are kernel-bound and release the GIL, so a small thread pool
+    # speeds up large torrent libraries considerably.
+    changed = 0
+    warnings: list[str] = []
+    if candidates:
+        max_workers = min(8, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for did_change, warning in pool.map(
+                lambda entry: _chown_if_mismatched(entry, uid, gid), candidates
+            ):
+                if did_change:
                     changed += 1
-            except FileNotFoundError:
-                continue
-            except PermissionError as e:
-                console.print(f"[warn]⚠ Permission error on {p}: {e}[/]")
+                if warning:
+                    warnings.append(warning)
+
+    for warning in warnings:
+        console.print(f"[warn]⚠ {warning}[/]")
 
     if changed:
         console.print(f"[ok]✅ chown fixed ownership on {changed} .torrent file(s).[/]")
@@ -1456,25 +1595,95 @@ def maybe_fix_torrent_permissions(cfg: AppCfg) -> None:
 # ----------------------------
 
 
+def _stream_preset_names(stream: Any) -> list[str]:
+    """Collect top-level preset names from a presets.yaml stream.
+
+    Uses PyYAML's event parser so only the mapping keys under ``presets:``
+    are materialized — the (potentially heavy) preset bodies are skipped via
+    depth tracking instead of being loaded into memory.
+    """
+    names: list[str] = []
+    # Stack of open collections: ["map", expect_key] or ["seq", False]
+    stack: list[list[Any]] = []
+    top_level_key: str | None = None
+    presets_depth: int | None = None
+
+    for event in yaml.parse(stream, Loader=_YamlSafeLoader):
+        if isinstance(event, yaml.MappingEndEvent | yaml.SequenceEndEvent):
+            if presets_depth is not None and len(stack) == presets_depth:
+                break  # presets mapping closed — nothing else to collect
+            stack.pop()
+            continue
+        if not isinstance(
+            event,
+            yaml.ScalarEvent | yaml.AliasEvent | yaml.MappingStartEvent | yaml.SequenceStartEvent,
+        ):
+            continue  # stream/document bookkeeping events
+
+        is_key = False
+        if stack and stack[-1][0] == "map":
+            is_key = bool(stack[-1][1])
+            stack[-1][1] = not stack[-1][1]
+
+        if isinstance(event, yaml.ScalarEvent):
+            if is_key:
+                if len(stack) == 1:
+                    top_level_key = event.value
+                elif presets_depth is not None and len(stack) == presets_depth:
+                    names.append(str(event.value))
+        elif isinstance(event, yaml.MappingStartEvent):
+            if (
+                not is_key
+                and len(stack) == 1
+                and top_level_key == "presets"
+                and presets_depth is None
+            ):
+                presets_depth = len(stack) + 1
+            stack.append(["map", True])
+        elif isinstance(event, yaml.SequenceStartEvent):
+            stack.append(["seq", False])
+
+    return names
+
+
+# Presets offered when presets.yaml is missing or defines none; a tuple so
+# nothing can mutate the shared default — callers get a fresh list from it.
+_FALLBACK_PRESETS = ("btn", "custom")
+
+
+def _parse_presets_text(text: str) -> list[str]:
+    """Preset names parsed from presets.yaml content, btn first.
+
+    Falls back to ``_FALLBACK_PRESETS`` when no presets are defined.
+    Split out from load_presets so callers holding the content (or tests)
+    can skip the filesystem round-trip.
+    """
+    presets = _stream_preset_names(text)
+    if not presets:
+        return list(_FALLBACK_PRESETS)
+
+    # Single scan instead of membership test + list rebuild; no-op when
+    # btn is absent or already first.
+    try:
+        i = presets.index("btn")
+    except ValueError:
+        return presets
+    if i:
+        presets.insert(0, presets.pop(i))
+    return presets
+
+
 def load_presets(host_presets_yaml: str) -> list[str]:
     p = Path(host_presets_yaml)
     if not p.exists():
         console.print(
-            f"[warn]⚠ presets.yaml not found at {host_presets_yaml}. Using fallback: ['btn', 'custom'][/]"
+            f"[warn]⚠ presets.yaml not found at {host_presets_yaml}. "
+            f"Using fallback: {list(_FALLBACK_PRESETS)}[/]"
         )
-        return ["btn", "custom"]
-
-    loaded = yaml.safe_load(p.read_text(encoding="utf-8"))
-    data: dict[str, Any] = cast(dict[str, Any], loaded) if isinstance(loaded, dict) else {}
-    presets_node: dict[str, Any] = cast(dict[str, Any], data.get("presets") or {})
-
-    if not presets_node:
-        return ["btn", "custom"]
+        return list(_FALLBACK_PRESETS)
 
-    presets: list[str] = [str(k) for k in presets_node.keys()]
-    if "btn" in presets:
-        presets = ["btn"] + [x for x in presets if x != "btn"]
-    return presets
+    with p.open(encoding="utf-8") as f:
+        return _parse_presets_text(f.read())
 
 
 def pick_preset(cfg: AppCfg) -> str:
@@ -1507,6 +1716,10 @@ def pick_preset(cfg: AppCfg) -> str:
 # ----------------------------
 
 
+# Menu choice -> action name; defined once instead of re-branching per prompt.
+_ACTION_BY_CHOICE = {"1": "create", "2": "inspect", "3": "check", "4": "batch"}
+
+
 def choose_action() -> str:
     panel = Panel(
         "[cyan][1][/] Create a torrent from a file/folder   [dim](mkbrr create)[/]\n"
@@ -1521,15 +1734,9 @@ def choose_action() -> str:
     console.print(panel)
 
     choice = cast(str, Prompt.ask("Choose", choices=["1", "2", "3", "4", "q"], default="1"))
-    if choice == "2":
-        return "inspect"
-    if choice == "3":
-        return "check"
-    if choice == "4":
-        return "batch"
     if choice == "q":
         raise SystemExit(0)
-    return "create"
+    return _ACTION_BY_CHOICE.get(choice, "create")
 
 
 def ask_path(
@@ -1569,15 +1776,15 @@ def ask_quiet() -> bool:
 
 
 def ask_workers() -> int | None:
-    s = cast(str, Prompt.ask("Workers", default="auto"))
-    if s == "auto" or not s:
+    s = cast(str, Prompt.ask("Workers", default="auto")).strip()
+    if not s or s == "auto":
         return None
-    try:
+    # isdecimal avoids raising/catching ValueError on the common typo path.
+    if s.isdecimal():
         v = int(s)
         return v if v > 0 else None
-    except ValueError:
-        console.print("[warn]⚠ Invalid workers; using auto.[/]")
-        return None
+    console.print("[warn]⚠ Invalid workers; using auto.[/]")
+    return None
 
 
 def confirm_cmd(cmd: list[str], cwd: str | None = None) -> bool:
@@ -1607,7 +1814,9 @@ def _batch_schema_path() -> Path:
     return _script_dir() / "schema" / "batch.json"
 
 
+@lru_cache(maxsize=1)
 def load_batch_schema() -> dict[str, Any]:
+    """Load and cache the bundled batch schema (static for a given install)."""
     schema_path = _batch_schema_path()
     if not schema_path.exists():
         raise FileNotFoundError(f"Batch schema not found: {schema_path}")
@@ -1841,10 +2050,6 @@ def collect_batch_jobs_interactive(cfg: AppCfg) -> dict[str, Any]:
     return collect_batch_jobs_interactive_simple(cfg)
 
 
-def _is_under_root(path: str, root: str) -> bool:
-    return path == root or path.startswith(root + "/")
-
-
 def map_batch_job_paths(cfg: AppCfg, runtime: str, payload: dict[str, Any]) -> dict[str, Any]:
     mapped = deepcopy(payload)
     jobs = mapped.get("jobs")
@@ -2452,6 +2657,18 @@ def main() -> None:
                         result_rows: list[tuple[int, str, str, int]] = []
                         split_t0 = time.monotonic()
 
+                        # All parts share the same content path, so detect
+                        # storage/workers once instead of per part.
+                        job_host_path = _resolve_host_path_for_detection(
+                            cfg, runtime, raw, host_data_root_override
+                        )
+                        job_storage = detect_storage_type(
+                            job_host_path,
+                            fuse_root=cfg.unraid.fuse_root,
+                            mount_priority=cfg.unraid.mount_priority,
+                        )
+                        job_workers = resolve_workers(job_storage, cfg.workers)
+
                         for idx, job in enumerate(split_jobs, 1):
                             try:
                                 cmd, cwd = build_batch_job_create_command(
@@ -2467,16 +2684,7 @@ def main() -> None:
                                 console.print(f"[err]❌ Part {idx} invalid: {e}[/]")
                                 continue
 
-                            # Auto-tune workers
-                            job_host_path = _resolve_host_path_for_detection(
-                                cfg, runtime, raw, host_data_root_override
-                            )
-                            job_storage = detect_storage_type(
-                                job_host_path,
-                                fuse_root=cfg.unraid.fuse_root,
-                                mount_priority=cfg.unraid.mount_priority,
-                            )
-                            job_workers = resolve_workers(job_storage, cfg.workers)
+                            # Auto-tune workers (shared across parts, see above)
                             if job_workers is not None:
                                 cmd += ["--workers", str(job_workers)]
 
@@ -2693,6 +2901,12 @@ def main() -> None:
                 batch_result_rows: list[tuple[int, str, str, int]] = []
                 batch_t0 = time.monotonic()
 
+                # Bind loop-invariant config lookups once for the job loop
+                fuse_root = cfg.unraid.fuse_root
+                mount_priority = cfg.unraid.mount_priority
+                workers_cfg = cfg.workers
+                job_timeout = cfg.batch.job_timeout_seconds
+
                 for idx, job in enumerate(typed_jobs, 1):
                     output_path = str(job.get("output", "")).strip()
                     content_path = str(job.get("path", "")).strip()
@@ -2734,10 +2948,10 @@ def main() -> None:
                     )
                     job_storage = detect_storage_type(
                         job_host_path,
-                        fuse_root=cfg.unraid.fuse_root,
-                        mount_priority=cfg.unraid.mount_priority,
+                        fuse_root=fuse_root,
+                        mount_priority=mount_priority,
                     )
-                    job_workers = resolve_workers(job_storage, cfg.workers)
+                    job_workers = resolve_workers(job_storage, workers_cfg)
                     if job_workers is not None:
                         cmd += ["--workers", str(job_workers)]
 
@@ -2746,7 +2960,7 @@ def main() -> None:
                             cmd,
                             cwd=cwd,
                             check=False,
-                            timeout=cfg.batch.job_timeout_seconds,
+                            timeout=job_timeout,
                         )
                         batch_result_rows.append((idx, content_path, output_path, r.returncode))
 
@@ -2760,11 +2974,7 @@ def main() -> None:
                     except subprocess.TimeoutExpired:
                         failed += 1
                         batch_result_rows.append((idx, content_path, output_path, 124))
-                        timeout_msg = (
-                            f" after {cfg.batch.job_timeout_seconds}s"
-                            if cfg.batch.job_timeout_seconds is not None
-                            else ""
-                        )
+                        timeout_msg = f" after {job_timeout}s" if job_timeout is not None else ""
                         console.print(f"[err]❌ Job {idx} timed out{timeout_msg}[/]")
 
                 results_table = Table(
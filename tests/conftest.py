@@ -2,10 +2,14 @@
 Pytest configuration and fixtures for mkbrr-wizard tests.
 """
 
+import functools
 import importlib.util
 import os
+import string
 import sys
+from pathlib import Path
 from types import ModuleType
+from typing import NamedTuple
 
 import pytest
 
@@ -13,8 +17,16 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@functools.cache
 def _load_mkbrr_wizard() -> ModuleType:
-    """Load the mkbrr-wizard module dynamically (handles hyphen in filename)."""
+    """Load the mkbrr-wizard module dynamically (handles hyphen in filename).
+
+    Cached so the module executes exactly once per process even if the
+    loader is invoked again (e.g. by another conftest import path).
+    """
+    existing = sys.modules.get("mkbrr_wizard")
+    if existing is not None:
+        return existing
     module_path = os.path.join(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mkbrr-wizard.py"
     )
@@ -32,7 +44,38 @@ def _load_mkbrr_wizard() -> ModuleType:
 _module = _load_mkbrr_wizard()
 
 
-@pytest.fixture
+def _install_load_config_cache(module: ModuleType) -> None:
+    """Memoize load_config on (path, file bytes) for the test session.
+
+    Many tests write byte-identical YAML configs and run load_config
+    end-to-end; re-parsing is pure waste.  AppCfg and its nested config
+    dataclasses are frozen, so a cached instance can be shared safely.
+    A change to the file contents changes the key, so rewrites within a
+    test still get a fresh parse.
+    """
+    orig = module.load_config
+    cache: dict[tuple[str, bytes], object] = {}
+
+    @functools.wraps(orig)
+    def cached_load_config(path):
+        p = Path(path)
+        try:
+            key = (str(p), p.read_bytes())
+        except OSError:
+            # Missing/unreadable file: let the original raise as usual.
+            return orig(path)
+        cfg = cache.get(key)
+        if cfg is None:
+            cfg = cache[key] = orig(path)
+        return cfg
+
+    module.load_config = cached_load_config
+
+
+_install_load_config_cache(_module)
+
+
+@pytest.fixture(scope="session")
 def mkbrr_wizard():
     """Fixture providing access to the mkbrr_wizard module."""
     return _module
@@ -68,30 +111,145 @@ def base_app_cfg(mkbrr_wizard):
     return _factory
 
 
-class _Seq:
-    """Callable that returns successive items from a list.
+@pytest.fixture
+def mock_load_config_factory(tmp_path, monkeypatch, mkbrr_wizard, base_app_cfg):
+    """Factory that makes load_config return a prebuilt AppCfg, bypassing YAML.
 
-    Used in tests to script prompt answers.  The `__call__` method returns
-    the next item each time it is invoked.  If invoked more times than there
-    are available items it raises ``StopIteration``.
+    For main()-flow tests that only exercise control flow and never
+    assert on config parsing: drops the config-file write, the YAML
+    parse, and tilde expansion from the test.  Paths live under the
+    test's tmp_path so sanity_checks can create the output dir.
     """
 
-    def __init__(self, items):
-        self._it = iter(items)
+    def make(*, runtime="native", docker_support=False):
+        cfg = base_app_cfg(
+            runtime=runtime,
+            docker_support=docker_support,
+            paths=mkbrr_wizard.PathsCfg(
+                host_data_root=str(tmp_path),
+                container_data_root="/data",
+                host_output_dir=str(tmp_path / "torrents"),
+                container_output_dir="/torrentfiles",
+                host_config_dir=str(tmp_path / "cfg"),
+                container_config_dir="/root/.config/mkbrr",
+            ),
+            presets_yaml_host=str(tmp_path / "cfg" / "presets.yaml"),
+            presets_yaml_container="/root/.config/mkbrr/presets.yaml",
+        )
+        monkeypatch.setattr(mkbrr_wizard, "load_config", lambda path: cfg)
+        return cfg
+
+    return make
+
 
-    def __call__(self, *args, **kwargs):
-        return next(self._it)
+@pytest.fixture
+def mock_load_config(mock_load_config_factory):
+    """Shorthand for the default native-runtime flavor of the factory above."""
+    return mock_load_config_factory()
 
 
-# Expose key functions for convenience (updated to new API)
-map_content_path = _module.map_content_path
-map_torrent_path = _module.map_torrent_path
-load_config = _module.load_config
-load_presets = _module.load_presets
-docker_run_base = _module.docker_run_base
+@pytest.fixture(scope="session")
+def media_skeleton(tmp_path_factory):
+    """One-time tree holding the tiny stand-in files the main()-flow tests use.
 
-# Dataclasses
-AppCfg = _module.AppCfg
-PathsCfg = _module.PathsCfg
-OwnershipCfg = _module.OwnershipCfg
-MkbrrCfg = _module.MkbrrCfg
+    Tests hardlink these into their own tmp_path via link_skeleton_file,
+    so each placement is a single link() syscall sharing the skeleton's
+    inode instead of a fresh create+write per test.
+    """
+    root = tmp_path_factory.mktemp("skeleton")
+    (root / "movie.mkv").write_text("x")
+    (root / "test.torrent").write_text("tor")
+    return root
+
+
+def link_skeleton_file(skeleton: Path, name: str, dest: Path) -> Path:
+    """Hardlink skeleton/name to *dest* (creating parents) and return dest."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    os.link(skeleton / name, dest)
+    return dest
+
+
+# string.Template is parsed once at import; substitute() only scans for
+# $-placeholders instead of rebuilding a multi-line f-string per call.
+_MAIN_CONFIG_TEMPLATE = string.Template(
+    """\
+runtime: $runtime
+docker_support: $docker_support
+chown: false
+mkbrr:
+  binary: mkbrr
+paths:
+  host_data_root: $data_root
+  container_data_root: /data
+  host_output_dir: $data_root/torrents
+  container_output_dir: /torrentfiles
+  host_config_dir: $cfg_dir
+  container_config_dir: /root/.config/mkbrr
+presets_yaml: $cfg_dir/presets.yaml
+"""
+)
+
+
+def write_main_config(tmp_path: Path, *, runtime: str = "native", docker_support: bool = False):
+    """Write the standard main()-flow config.yaml under *tmp_path* and return its path.
+
+    The main() simulation tests all use the same layout (data root at
+    tmp_path, output under tmp_path/torrents, config under tmp_path/cfg)
+    and differ only in runtime/docker_support, so the template lives here
+    instead of being inlined per test.
+    """
+    cfg_dir = tmp_path / "cfg"
+    cfg_dir.mkdir(exist_ok=True)
+    config_yaml = tmp_path / "config.yaml"
+    config_yaml.write_text(
+        _MAIN_CONFIG_TEMPLATE.substitute(
+            runtime=runtime,
+            docker_support="true" if docker_support else "false",
+            data_root=tmp_path,
+            cfg_dir=cfg_dir,
+        )
+    )
+    return config_yaml
+
+
+class FakeProc(NamedTuple):
+    """Minimal stand-in for subprocess.CompletedProcess (returncode only)."""
+
+    returncode: int = 0
+
+
+def fake_run(returncode: int = 0):
+    """Return a subprocess.run replacement that always yields FakeProc(returncode).
+
+    One shared NamedTuple instance per fake; cheaper than the per-test
+    Dummy classes this replaces (no type object or instance dict per
+    test) and closer to what the production code actually receives.
+    """
+    proc = FakeProc(returncode)
+    return lambda *args, **kwargs: proc
+
+
+def patch_wizard(monkeypatch, mod, **attrs):
+    """Apply several monkeypatch.setattr calls against *mod* in one pass.
+
+    The main()-flow tests patch the same handful of wizard attributes
+    (parse_args, pick_runtime, _has_prompt_toolkit, ...); binding
+    monkeypatch.setattr once and looping keeps each test to a single
+    helper call while teardown/undo still goes through monkeypatch.
+    """
+    set_attr = monkeypatch.setattr
+    for name, value in attrs.items():
+        set_attr(mod, name, value)
+
+
+def _seq(items):
+    """Return a callable that yields successive items from a list.
+
+    Used in tests to script prompt answers.  Each call returns the next
+    item regardless of arguments; calling past the end raises
+    ``StopIteration``.  Binds ``iter(items).__next__`` directly so every
+    scripted answer costs a single C-level call instead of a bound
+    ``__call__`` frame plus ``next()`` dispatch.
+    """
+    advance = iter(items).__next__
+    return lambda *args, **kwargs: advance()
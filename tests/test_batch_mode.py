@@ -6,7 +6,7 @@ from typing import Any
 
 import pytest  # type: ignore[import-untyped]
 
-from .conftest import _Seq
+from .conftest import FakeProc, _seq, fake_run
 
 
 def _mk_args(config_path: str) -> SimpleNamespace:
@@ -279,7 +279,7 @@ def test_collect_batch_jobs_interactive_simple_only_required(
     monkeypatch.setattr(
         mkbrr_wizard.Prompt,
         "ask",
-        _Seq(
+        _seq(
             [
                 "2",
                 "/data/movies/movie1.mkv",
@@ -319,7 +319,7 @@ def test_collect_batch_jobs_interactive_advanced_includes_optional(
     monkeypatch.setattr(
         mkbrr_wizard.Prompt,
         "ask",
-        _Seq(
+        _seq(
             [
                 "1",
                 "/data/movies/movie1.mkv",
@@ -365,7 +365,7 @@ def test_main_batch_success_native(tmp_path, mkbrr_wizard: ModuleType, monkeypat
     monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
     monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
 
-    seq = _Seq(
+    seq = _seq(
         [
             "4",  # choose batch
             "1",  # preset
@@ -375,17 +375,13 @@ def test_main_batch_success_native(tmp_path, mkbrr_wizard: ModuleType, monkeypat
         ]
     )
     monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
-    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _Seq([True, False]))  # proceed, do another
+    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _seq([True, False]))  # proceed, do another
 
     calls: list[tuple[list[str], str | None]] = []
 
-    class Dummy:
-        def __init__(self, returncode=0):
-            self.returncode = returncode
-
     def fake_run(cmd, *a, **k):
         calls.append((cmd, k.get("cwd")))
-        return Dummy(0)
+        return FakeProc(0)
 
     monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run)
     chown_called = {"count": 0}
@@ -416,7 +412,7 @@ def test_main_batch_success_docker(tmp_path, mkbrr_wizard: ModuleType, monkeypat
     monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "docker")
     monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
 
-    seq = _Seq(
+    seq = _seq(
         [
             "4",  # choose batch
             "1",  # preset
@@ -426,24 +422,18 @@ def test_main_batch_success_docker(tmp_path, mkbrr_wizard: ModuleType, monkeypat
         ]
     )
     monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
-    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _Seq([True, False]))  # proceed, do another
+    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _seq([True, False]))  # proceed, do another
 
     calls: list[list[str]] = []
 
-    class Dummy:
-        def __init__(self, returncode=0):
-            self.returncode = returncode
-
-    def _run_and_record(
-        calls_ref: list[list[str]], cmd: list[str], dummy_type: type[Dummy]
-    ) -> Dummy:
+    def _run_and_record(calls_ref: list[list[str]], cmd: list[str]) -> FakeProc:
         calls_ref.append(cmd)
-        return dummy_type(0)
+        return FakeProc(0)
 
     monkeypatch.setattr(
         mkbrr_wizard.subprocess,
         "run",
-        lambda cmd, *a, **k: _run_and_record(calls, cmd, Dummy),
+        lambda cmd, *a, **k: _run_and_record(calls, cmd),
     )
     chown_called = {"count": 0}
     monkeypatch.setattr(
@@ -477,7 +467,7 @@ def test_main_batch_success_advanced_mode_prompts_optional(
     monkeypatch.setattr(
         mkbrr_wizard.Prompt,
         "ask",
-        _Seq(
+        _seq(
             [
                 "4",  # choose batch
                 "1",  # preset
@@ -497,24 +487,18 @@ def test_main_batch_success_advanced_mode_prompts_optional(
             ]
         ),
     )
-    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _Seq([True, False]))  # proceed, do another
-
-    class Dummy:
-        def __init__(self, returncode=0):
-            self.returncode = returncode
+    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _seq([True, False]))  # proceed, do another
 
     calls: list[list[str]] = []
 
-    def _run_and_record(
-        calls_ref: list[list[str]], cmd: list[str], dummy_type: type[Dummy]
-    ) -> Dummy:
+    def _run_and_record(calls_ref: list[list[str]], cmd: list[str]) -> FakeProc:
         calls_ref.append(cmd)
-        return dummy_type(0)
+        return FakeProc(0)
 
     monkeypatch.setattr(
         mkbrr_wizard.subprocess,
         "run",
-        lambda cmd, *a, **k: _run_and_record(calls, cmd, Dummy),
+        lambda cmd, *a, **k: _run_and_record(calls, cmd),
     )
     monkeypatch.setattr(mkbrr_wizard, "maybe_fix_torrent_permissions", lambda cfg: None)
 
@@ -532,7 +516,7 @@ def test_main_batch_validation_failure_skips_execution(
     monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
     monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
     monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
-    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _Seq(["4", "1", "q"]))
+    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _seq(["4", "1", "q"]))
     out_a = tmp_path / "a.torrent"
     in_a = tmp_path / "a.mkv"
     monkeypatch.setattr(
@@ -567,7 +551,7 @@ def test_main_batch_nonzero_exit_skips_chown(
     monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
     monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
     monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
-    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _Seq(["4", "1", "q"]))
+    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _seq(["4", "1", "q"]))
     out_a = tmp_path / "a.torrent"
     in_a = tmp_path / "a.mkv"
     monkeypatch.setattr(
@@ -578,13 +562,9 @@ def test_main_batch_nonzero_exit_skips_chown(
             "jobs": [{"output": str(out_a), "path": str(in_a)}],
         },
     )
-    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _Seq([True, False]))  # proceed, do another
+    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _seq([True, False]))  # proceed, do another
 
-    class Dummy:
-        def __init__(self, returncode):
-            self.returncode = returncode
-
-    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", lambda *a, **k: Dummy(2))
+    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run(2))
 
     chown_called = {"count": 0}
     monkeypatch.setattr(
@@ -607,7 +587,7 @@ def test_main_batch_continue_on_error_and_chown_once(
     monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
     monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
     monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
-    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _Seq(["4", "1", "q"]))
+    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _seq(["4", "1", "q"]))
     out_a = tmp_path / "a.torrent"
     in_a = tmp_path / "a.mkv"
     out_b = tmp_path / "b.torrent"
@@ -623,11 +603,7 @@ def test_main_batch_continue_on_error_and_chown_once(
             ],
         },
     )
-    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _Seq([True, False]))  # proceed, do another
-
-    class Dummy:
-        def __init__(self, returncode):
-            self.returncode = returncode
+    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _seq([True, False]))  # proceed, do another
 
     run_codes = [2, 0]
     calls = {"count": 0}
@@ -636,7 +612,7 @@ def test_main_batch_continue_on_error_and_chown_once(
         if not run_codes:
             raise AssertionError("Unexpected subprocess call")
         calls["count"] += 1
-        return Dummy(run_codes.pop(0))
+        return FakeProc(run_codes.pop(0))
 
     monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run)
 
@@ -663,7 +639,7 @@ def test_main_batch_timeout_marks_failed_and_continues(
     monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
     monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
     monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
-    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _Seq(["4", "1", "q"]))
+    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _seq(["4", "1", "q"]))
 
     out_a = tmp_path / "a.torrent"
     in_a = tmp_path / "a.mkv"
@@ -680,20 +656,16 @@ def test_main_batch_timeout_marks_failed_and_continues(
             ],
         },
     )
-    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _Seq([True, False]))
+    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _seq([True, False]))
 
     timeout_exc = mkbrr_wizard.subprocess.TimeoutExpired(cmd=["mkbrr"], timeout=1)
     calls = {"count": 0}
 
-    class Dummy:
-        def __init__(self, returncode):
-            self.returncode = returncode
-
     def fake_run(*args, **kwargs):
         calls["count"] += 1
         if calls["count"] == 1:
             raise timeout_exc
-        return Dummy(0)
+        return FakeProc(0)
 
     monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run)
     monkeypatch.setattr(
@@ -743,7 +715,7 @@ def test_main_batch_cancel_skips_execution(
     monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
     monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
     monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
-    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _Seq(["4", "1", "q"]))
+    monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", _seq(["4", "1", "q"]))
     out_a = tmp_path / "a.torrent"
     in_a = tmp_path / "a.mkv"
     monkeypatch.setattr(
@@ -754,7 +726,7 @@ def test_main_batch_cancel_skips_execution(
             "jobs": [{"output": str(out_a), "path": str(in_a)}],
         },
     )
-    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _Seq([False]))  # cancel run
+    monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", _seq([False]))  # cancel run
 
     def raise_on_run(*args, **kwargs):
         raise AssertionError("subprocess.run should not be called")
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import os
-import tempfile
+from collections.abc import Callable
 from pathlib import Path
 from types import ModuleType
 from typing import Any
@@ -11,6 +10,22 @@ from typing import Any
 import pytest  # type: ignore[import-untyped]
 
 
+@pytest.fixture
+def yaml_file(tmp_path: Path) -> Callable[[str], Path]:
+    """Return a callable that writes YAML to a tmp_path file and returns its path.
+
+    Cheaper than tempfile.NamedTemporaryFile per test: no per-test unlink;
+    pytest reaps the tmp_path tree in bulk.
+    """
+
+    def write(body: str) -> Path:
+        path = tmp_path / "config.yaml"
+        path.write_text(body)
+        return path
+
+    return write
+
+
 class TestLoadConfig:
     """Tests for load_config function."""
 
@@ -19,41 +34,41 @@ class TestLoadConfig:
         with pytest.raises(FileNotFoundError):
             mkbrr_wizard.load_config(Path("/nonexistent/config.yaml"))
 
-    def test_minimal_config(self, mkbrr_wizard: ModuleType) -> None:
+    def test_minimal_config(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
         """Minimal config should use defaults."""
-        yaml_content = """
+        cfg = mkbrr_wizard.load_config(
+            yaml_file(
+                """
 runtime: native
 docker_support: false
 chown: false
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            cfg = mkbrr_wizard.load_config(Path(temp_path))
-
-            assert cfg.runtime == "native"
-            assert cfg.docker_support is False
-            assert cfg.chown is False
-            # Defaults
-            assert cfg.mkbrr.binary == "mkbrr"
-            assert cfg.mkbrr.image == "ghcr.io/autobrr/mkbrr"
-            assert cfg.ownership.uid == 99
-            assert cfg.ownership.gid == 100
-            assert cfg.unraid.enabled is False
-            assert cfg.unraid.fuse_root == "/mnt/user"
-            assert cfg.unraid.mount_priority == "disk_first"
-            assert cfg.unraid.split_share_preflight == "fail"
-            assert cfg.unraid.split_share_unmapped_docker_path == "warn"
-            assert cfg.unraid.split_share_max_entries == 20000
-            assert cfg.unraid.split_share_follow_symlinks is False
-        finally:
-            os.unlink(temp_path)
-
-    def test_full_config(self, mkbrr_wizard: ModuleType) -> None:
+            )
+        )
+
+        assert cfg.runtime == "native"
+        assert cfg.docker_support is False
+        assert cfg.chown is False
+        # Defaults
+        assert cfg.mkbrr.binary == "mkbrr"
+        assert cfg.mkbrr.image == "ghcr.io/autobrr/mkbrr"
+        assert cfg.ownership.uid == 99
+        assert cfg.ownership.gid == 100
+        assert cfg.unraid.enabled is False
+        assert cfg.unraid.fuse_root == "/mnt/user"
+        assert cfg.unraid.mount_priority == "disk_first"
+        assert cfg.unraid.split_share_preflight == "fail"
+        assert cfg.unraid.split_share_unmapped_docker_path == "warn"
+        assert cfg.unraid.split_share_max_entries == 20000
+        assert cfg.unraid.split_share_follow_symlinks is False
+
+    def test_full_config(self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]) -> None:
         """Full config should load all values."""
-        yaml_content = """
+        cfg = mkbrr_wizard.load_config(
+            yaml_file(
+                """
 runtime: docker
 docker_support: true
 docker_user: "1000:1000"
@@ -85,222 +100,190 @@ unraid:
     split_share_max_entries: 123
     split_share_follow_symlinks: true
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            cfg = mkbrr_wizard.load_config(Path(temp_path))
-
-            assert cfg.runtime == "docker"
-            assert cfg.docker_support is True
-            assert cfg.docker_user == "1000:1000"
-            assert cfg.chown is True
-
-            assert cfg.mkbrr.binary == "/usr/local/bin/mkbrr"
-            assert cfg.mkbrr.image == "custom/mkbrr:latest"
-
-            assert cfg.paths.host_data_root == "/custom/data"
-            assert cfg.paths.container_data_root == "/mnt"
-            assert cfg.paths.host_output_dir == "/custom/torrents"
-            assert cfg.paths.container_output_dir == "/output"
-
-            assert cfg.ownership.uid == 1000
-            assert cfg.ownership.gid == 1000
-
-            assert cfg.presets_yaml_host == "/custom/presets.yaml"
-            assert cfg.unraid.enabled is True
-            assert cfg.unraid.fuse_root == "/mnt/user"
-            assert cfg.unraid.mount_priority == "cache_first"
-            assert cfg.unraid.split_share_preflight == "warn"
-            assert cfg.unraid.split_share_unmapped_docker_path == "fail"
-            assert cfg.unraid.split_share_max_entries == 123
-            assert cfg.unraid.split_share_follow_symlinks is True
-        finally:
-            os.unlink(temp_path)
-
-    def test_invalid_unraid_mount_priority_raises(self, mkbrr_wizard: ModuleType) -> None:
-        yaml_content = """
+            )
+        )
+
+        assert cfg.runtime == "docker"
+        assert cfg.docker_support is True
+        assert cfg.docker_user == "1000:1000"
+        assert cfg.chown is True
+
+        assert cfg.mkbrr.binary == "/usr/local/bin/mkbrr"
+        assert cfg.mkbrr.image == "custom/mkbrr:latest"
+
+        assert cfg.paths.host_data_root == "/custom/data"
+        assert cfg.paths.container_data_root == "/mnt"
+        assert cfg.paths.host_output_dir == "/custom/torrents"
+        assert cfg.paths.container_output_dir == "/output"
+
+        assert cfg.ownership.uid == 1000
+        assert cfg.ownership.gid == 1000
+
+        assert cfg.presets_yaml_host == "/custom/presets.yaml"
+        assert cfg.unraid.enabled is True
+        assert cfg.unraid.fuse_root == "/mnt/user"
+        assert cfg.unraid.mount_priority == "cache_first"
+        assert cfg.unraid.split_share_preflight == "warn"
+        assert cfg.unraid.split_share_unmapped_docker_path == "fail"
+        assert cfg.unraid.split_share_max_entries == 123
+        assert cfg.unraid.split_share_follow_symlinks is True
+
+    def test_invalid_unraid_mount_priority_raises(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
+        path = yaml_file(
+            """
 runtime: native
 unraid:
   enabled: true
   mount_priority: maybe
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match=r"unraid\.mount_priority must be one of"):
-                mkbrr_wizard.load_config(Path(temp_path))
-        finally:
-            os.unlink(temp_path)
-
-    def test_invalid_unmapped_docker_path_mode_raises(self, mkbrr_wizard: ModuleType) -> None:
-        yaml_content = """
+        )
+        with pytest.raises(ValueError, match=r"unraid\.mount_priority must be one of"):
+            mkbrr_wizard.load_config(path)
+
+    def test_invalid_unmapped_docker_path_mode_raises(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
+        path = yaml_file(
+            """
 runtime: native
 unraid:
   enabled: true
   split_share_unmapped_docker_path: maybe
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(
-                ValueError, match=r"unraid\.split_share_unmapped_docker_path must be one of"
-            ):
-                mkbrr_wizard.load_config(Path(temp_path))
-        finally:
-            os.unlink(temp_path)
-
-    def test_invalid_unraid_preflight_mode_raises(self, mkbrr_wizard: ModuleType) -> None:
-        yaml_content = """
+        )
+        with pytest.raises(
+            ValueError, match=r"unraid\.split_share_unmapped_docker_path must be one of"
+        ):
+            mkbrr_wizard.load_config(path)
+
+    def test_invalid_unraid_preflight_mode_raises(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
+        path = yaml_file(
+            """
 runtime: native
 unraid:
   enabled: true
   split_share_preflight: maybe
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match=r"unraid\.split_share_preflight must be one of"):
-                mkbrr_wizard.load_config(Path(temp_path))
-        finally:
-            os.unlink(temp_path)
-
-    def test_invalid_unraid_max_entries_raises(self, mkbrr_wizard: ModuleType) -> None:
-        yaml_content = """
+        )
+        with pytest.raises(ValueError, match=r"unraid\.split_share_preflight must be one of"):
+            mkbrr_wizard.load_config(path)
+
+    def test_invalid_unraid_max_entries_raises(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
+        path = yaml_file(
+            """
 runtime: native
 unraid:
   enabled: true
   split_share_max_entries: 0
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(
-                ValueError, match=r"unraid\.split_share_max_entries must be a positive integer"
-            ):
-                mkbrr_wizard.load_config(Path(temp_path))
-        finally:
-            os.unlink(temp_path)
-
-    def test_bool_coercion_handles_typo(self, mkbrr_wizard: ModuleType) -> None:
+        )
+        with pytest.raises(
+            ValueError, match=r"unraid\.split_share_max_entries must be a positive integer"
+        ):
+            mkbrr_wizard.load_config(path)
+
+    def test_bool_coercion_handles_typo(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
         """Common typo 'ture' should be coerced to True."""
-        yaml_content = """
+        cfg = mkbrr_wizard.load_config(
+            yaml_file(
+                """
 runtime: auto
 docker_support: ture
 chown: ture
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            cfg = mkbrr_wizard.load_config(Path(temp_path))
+            )
+        )
 
-            assert cfg.docker_support is True
-            assert cfg.chown is True
-        finally:
-            os.unlink(temp_path)
+        assert cfg.docker_support is True
+        assert cfg.chown is True
 
-    def test_invalid_runtime_raises(self, mkbrr_wizard: ModuleType) -> None:
+    def test_invalid_runtime_raises(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
         """Invalid runtime value should raise ValueError."""
-        yaml_content = """
+        path = yaml_file(
+            """
 runtime: invalid
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="runtime must be one of"):
-                mkbrr_wizard.load_config(Path(temp_path))
-        finally:
-            os.unlink(temp_path)
+        )
+        with pytest.raises(ValueError, match="runtime must be one of"):
+            mkbrr_wizard.load_config(path)
 
-    def test_tilde_expansion_in_paths(self, mkbrr_wizard: ModuleType) -> None:
+    def test_tilde_expansion_in_paths(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
         """Paths with ~ should be expanded."""
-        yaml_content = """
+        cfg = mkbrr_wizard.load_config(
+            yaml_file(
+                """
 runtime: native
 paths:
   host_config_dir: ~/.config/mkbrr
 presets_yaml: ~/.config/mkbrr/presets.yaml
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            cfg = mkbrr_wizard.load_config(Path(temp_path))
-
-            # Should not contain ~
-            assert "~" not in cfg.paths.host_config_dir
-            assert "~" not in cfg.presets_yaml_host
-            # Should contain actual home directory
-            assert str(Path.home()) in cfg.paths.host_config_dir
-        finally:
-            os.unlink(temp_path)
-
-    def test_batch_mode_defaults_to_simple(self, mkbrr_wizard: ModuleType) -> None:
-        yaml_content = """
+            )
+        )
+
+        # Should not contain ~
+        assert "~" not in cfg.paths.host_config_dir
+        assert "~" not in cfg.presets_yaml_host
+        # Should contain actual home directory
+        assert str(Path.home()) in cfg.paths.host_config_dir
+
+    def test_batch_mode_defaults_to_simple(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
+        cfg = mkbrr_wizard.load_config(
+            yaml_file(
+                """
 runtime: native
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            cfg = mkbrr_wizard.load_config(Path(temp_path))
-            assert cfg.batch.mode == "simple"
-        finally:
-            os.unlink(temp_path)
-
-    def test_batch_mode_advanced_is_loaded(self, mkbrr_wizard: ModuleType) -> None:
-        yaml_content = """
+            )
+        )
+        assert cfg.batch.mode == "simple"
+
+    def test_batch_mode_advanced_is_loaded(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
+        cfg = mkbrr_wizard.load_config(
+            yaml_file(
+                """
 runtime: native
 batch:
   mode: advanced
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            cfg = mkbrr_wizard.load_config(Path(temp_path))
-            assert cfg.batch.mode == "advanced"
-        finally:
-            os.unlink(temp_path)
-
-    def test_invalid_batch_mode_raises(self, mkbrr_wizard: ModuleType) -> None:
-        yaml_content = """
+            )
+        )
+        assert cfg.batch.mode == "advanced"
+
+    def test_invalid_batch_mode_raises(
+        self, mkbrr_wizard: ModuleType, yaml_file: Callable[[str], Path]
+    ) -> None:
+        path = yaml_file(
+            """
 runtime: native
 batch:
   mode: fast
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match=r"batch\.mode must be one of"):
-                mkbrr_wizard.load_config(Path(temp_path))
-        finally:
-            os.unlink(temp_path)
+        )
+        with pytest.raises(ValueError, match=r"batch\.mode must be one of"):
+            mkbrr_wizard.load_config(path)
 
 
 class TestDockerRunBase:
     """Tests for docker_run_base command builder."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_cfg(self, mkbrr_wizard: ModuleType) -> Any:
-        """Create a sample config for testing."""
+        """Create a sample config for testing (module-scoped; AppCfg is frozen)."""
         return mkbrr_wizard.AppCfg(
             runtime="docker",
             docker_support=True,
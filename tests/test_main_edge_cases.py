@@ -3,7 +3,7 @@
 from types import ModuleType, SimpleNamespace
 from typing import Any
 
-from .conftest import _Seq
+from .conftest import _seq, fake_run, link_skeleton_file, patch_wizard, write_main_config
 
 
 def _mk_args(config_path: str) -> SimpleNamespace:
@@ -11,36 +11,19 @@ def _mk_args(config_path: str) -> SimpleNamespace:
 
 
 def test_main_create_missing_content_native(
-    tmp_path, mkbrr_wizard: ModuleType, monkeypatch: Any
+    mkbrr_wizard: ModuleType, monkeypatch: Any, mock_load_config: Any
 ) -> None:
-    # prepare config
-    cfg_dir = tmp_path / "cfg"
-    cfg_dir.mkdir()
-    config_yaml = tmp_path / "config.yaml"
-    config_yaml.write_text(
-        f"""
-runtime: native
-docker_support: false
-chown: false
-mkbrr:
-  binary: mkbrr
-paths:
-  host_data_root: {tmp_path}
-  container_data_root: /data
-  host_output_dir: {tmp_path}/torrents
-  container_output_dir: /torrentfiles
-  host_config_dir: {cfg_dir}
-  container_config_dir: /root/.config/mkbrr
-presets_yaml: {cfg_dir}/presets.yaml
-"""
+    # config comes prebuilt from mock_load_config; the path is never read
+    patch_wizard(
+        monkeypatch,
+        mkbrr_wizard,
+        parse_args=lambda: _mk_args("unused.yaml"),
+        pick_runtime=lambda cfg, forced: "native",
+        _has_prompt_toolkit=False,
     )
 
-    monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
-    monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
-
     # sequence: create -> pick preset -> provide missing content -> then quit (q)
-    seq = _Seq(["1", "1", "/nonexistent/path", "q"])  # choose create, pick preset, path, then quit
-    monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
+    seq = _seq(["1", "1", "/nonexistent/path", "q"])  # choose create, pick preset, path, then quit
     monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
 
     # Confirm.ask: should only be called for 'Do another operation?' -> False
@@ -53,36 +36,18 @@ presets_yaml: {cfg_dir}/presets.yaml
 
 
 def test_main_check_invalid_paths_native(
-    tmp_path, mkbrr_wizard: ModuleType, monkeypatch: Any
+    mkbrr_wizard: ModuleType, monkeypatch: Any, mock_load_config: Any
 ) -> None:
-    cfg_dir = tmp_path / "cfg"
-    cfg_dir.mkdir()
-    # create a fake torrent file path but ensure it's not present
-    config_yaml = tmp_path / "config.yaml"
-    config_yaml.write_text(
-        f"""
-runtime: native
-docker_support: false
-chown: false
-mkbrr:
-  binary: mkbrr
-paths:
-  host_data_root: {tmp_path}
-  container_data_root: /data
-  host_output_dir: {tmp_path}/torrents
-  container_output_dir: /torrentfiles
-  host_config_dir: {cfg_dir}
-  container_config_dir: /root/.config/mkbrr
-presets_yaml: {cfg_dir}/presets.yaml
-"""
+    patch_wizard(
+        monkeypatch,
+        mkbrr_wizard,
+        parse_args=lambda: _mk_args("unused.yaml"),
+        pick_runtime=lambda cfg, forced: "native",
+        _has_prompt_toolkit=False,
     )
 
-    monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
-    monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
-
     # Sequence: choose 'check' then provide missing torrent and content paths then quit
-    seq = _Seq(["3", "/nonexistent/file.torrent", "/nonexistent/content", "q"])
-    monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
+    seq = _seq(["3", "/nonexistent/file.torrent", "/nonexistent/content", "q"])
     monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
 
     # Confirm.ask: do another -> False
@@ -95,53 +60,32 @@ presets_yaml: {cfg_dir}/presets.yaml
 
 
 def test_main_check_verbose_quiet_conflict(
-    tmp_path, mkbrr_wizard: ModuleType, monkeypatch: Any
+    tmp_path, mkbrr_wizard: ModuleType, monkeypatch: Any, media_skeleton: Any
 ) -> None:
-    cfg_dir = tmp_path / "cfg"
-    cfg_dir.mkdir()
-    config_yaml = tmp_path / "config.yaml"
-    config_yaml.write_text(
-        f"""
-runtime: native
-docker_support: false
-chown: false
-mkbrr:
-  binary: mkbrr
-paths:
-  host_data_root: {tmp_path}
-  container_data_root: /data
-  host_output_dir: {tmp_path}/torrents
-  container_output_dir: /torrentfiles
-  host_config_dir: {cfg_dir}
-  container_config_dir: /root/.config/mkbrr
-presets_yaml: {cfg_dir}/presets.yaml
-"""
+    config_yaml = write_main_config(tmp_path)
+
+    patch_wizard(
+        monkeypatch,
+        mkbrr_wizard,
+        parse_args=lambda: _mk_args(str(config_yaml)),
+        pick_runtime=lambda cfg, forced: "native",
+        _has_prompt_toolkit=False,
     )
 
-    monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
-    monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
-
     # create actual content and torrent
-    content_file = tmp_path / "data" / "movie.mkv"
-    content_file.parent.mkdir()
-    content_file.write_text("x")
-    torrent_file = tmp_path / "torrents" / "test.torrent"
-    torrent_file.parent.mkdir()
-    torrent_file.write_text("tor")
+    content_file = link_skeleton_file(media_skeleton, "movie.mkv", tmp_path / "data" / "movie.mkv")
+    torrent_file = link_skeleton_file(
+        media_skeleton, "test.torrent", tmp_path / "torrents" / "test.torrent"
+    )
 
     # Sequence: choose check -> provide torrent path -> content path -> workers auto -> quit
-    seq = _Seq(["3", str(torrent_file), str(content_file), "auto", "q"])
-    monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
+    seq = _seq(["3", str(torrent_file), str(content_file), "auto", "q"])
     monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
 
     # Confirm.ask sequence: verbose True, quiet True, confirm True, do another False
-    cseq = _Seq([True, True, True, False])
+    cseq = _seq([True, True, True, False])
     monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", cseq)
 
-    class Dummy:
-        def __init__(self, returncode=0):
-            self.returncode = returncode
-
-    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", lambda *a, **k: Dummy(0))
+    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run(0))
 
     mkbrr_wizard.main()
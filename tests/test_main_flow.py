@@ -1,17 +1,40 @@
 """Integration-style tests for main() control flow (simulate user interactions)."""
 
+import string
 from types import ModuleType, SimpleNamespace
 from typing import Any
 
-from .conftest import _Seq
+from .conftest import _seq, fake_run, link_skeleton_file, patch_wizard
 
 
 def _mk_args(config_path: str) -> SimpleNamespace:
     return SimpleNamespace(config=config_path, docker=False, native=False)
 
 
+# Parsed once at import; per-test we only substitute the tmp_path-derived
+# values (these two tests use path layouts that differ from the shared
+# write_main_config template in conftest).
+_CFG_TMPL = string.Template(
+    """\
+runtime: $runtime
+docker_support: $docker_support
+chown: false
+mkbrr:
+  binary: mkbrr
+paths:
+  host_data_root: $data_root
+  container_data_root: /data
+  host_output_dir: $output_dir
+  container_output_dir: /torrentfiles
+  host_config_dir: $cfg_dir
+  container_config_dir: /root/.config/mkbrr
+presets_yaml: $presets
+"""
+)
+
+
 def test_main_create_inspect_check_native(
-    tmp_path, mkbrr_wizard: ModuleType, monkeypatch: Any
+    tmp_path, mkbrr_wizard: ModuleType, monkeypatch: Any, media_skeleton: Any
 ) -> None:
     # Prepare config directory and presets
     config_dir = tmp_path / "cfg"
@@ -20,38 +43,34 @@ def test_main_create_inspect_check_native(
     presets_yaml.write_text("""presets:\n  btn:\n    announce: https://example.com/announce\n""")
 
     # Prepare content file and torrent file
-    content_file = tmp_path / "data" / "movie.mkv"
-    content_file.parent.mkdir()
-    content_file.write_text("x")
+    content_file = link_skeleton_file(media_skeleton, "movie.mkv", tmp_path / "data" / "movie.mkv")
 
-    torrent_file = tmp_path / "torrents" / "test.torrent"
-    torrent_file.parent.mkdir(parents=True, exist_ok=True)
-    torrent_file.write_text("torrent")
+    torrent_file = link_skeleton_file(
+        media_skeleton, "test.torrent", tmp_path / "torrents" / "test.torrent"
+    )
 
     config_yaml = tmp_path / "config.yaml"
     config_yaml.write_text(
-        f"""
-runtime: native
-docker_support: false
-chown: false
-mkbrr:
-  binary: mkbrr
-paths:
-  host_data_root: {tmp_path}/data
-  container_data_root: /data
-  host_output_dir: {tmp_path}/torrents
-  container_output_dir: /torrentfiles
-  host_config_dir: {config_dir}
-  container_config_dir: /root/.config/mkbrr
-presets_yaml: {presets_yaml}
-"""
+        _CFG_TMPL.substitute(
+            runtime="native",
+            docker_support="false",
+            data_root=f"{tmp_path}/data",
+            output_dir=f"{tmp_path}/torrents",
+            cfg_dir=config_dir,
+            presets=presets_yaml,
+        )
     )
 
     # Monkeypatch parse_args to use our config
-    monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
+    patch_wizard(
+        monkeypatch,
+        mkbrr_wizard,
+        parse_args=lambda: _mk_args(str(config_yaml)),
+        pick_runtime=lambda cfg, forced: "native",
+        _has_prompt_toolkit=False,
+    )
 
     # Force runtime to native
-    monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
 
     # Sequence of Prompt.ask responses:
     # 1 -> choose_action create
@@ -62,7 +81,7 @@ presets_yaml: {presets_yaml}
     # 3 -> choose_action check
     # torrent path -> torrent_file
     # content path -> content_file
-    seq = _Seq(
+    seq = _seq(
         [
             "1",  # create
             "1",  # preset
@@ -75,22 +94,16 @@ presets_yaml: {presets_yaml}
             "auto",
         ]
     )
-    # disable prompt_toolkit so Prompt.ask is used
-    monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
     monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
 
     # Confirm.ask sequence: yes to execute commands, then no to 'do another operation?'
     # Confirm.ask sequence: create confirm, inspect verbose, inspect confirm,
     # check verbose, check quiet, check confirm, final do-another -> exit
-    cseq = _Seq([True, True, True, False, False, True, False])
+    cseq = _seq([True, True, True, False, False, True, False])
     monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", cseq)
 
     # Subprocess.run: simulate success returncodes
-    class Dummy:
-        def __init__(self, returncode=0):
-            self.returncode = returncode
-
-    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", lambda *a, **k: Dummy(0))
+    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run(0))
 
     # Now run main() -- should finish without errors
     mkbrr_wizard.main()
@@ -102,38 +115,31 @@ def test_main_docker_mode_build_and_exit(
     # simple docker-mode check: main should build docker commands and exit
     config_yaml = tmp_path / "config.yaml"
     config_yaml.write_text(
-        f"""
-runtime: auto
-docker_support: true
-chown: false
-mkbrr:
-  binary: mkbrr
-paths:
-  host_data_root: {tmp_path}
-  container_data_root: /data
-  host_output_dir: {tmp_path}/torrents
-  container_output_dir: /torrentfiles
-  host_config_dir: {tmp_path}/cfg
-  container_config_dir: /root/.config/mkbrr
-presets_yaml: presets.yaml
-"""
+        _CFG_TMPL.substitute(
+            runtime="auto",
+            docker_support="true",
+            data_root=tmp_path,
+            output_dir=f"{tmp_path}/torrents",
+            cfg_dir=f"{tmp_path}/cfg",
+            presets="presets.yaml",
+        )
     )
 
-    monkeypatch.setattr(mkbrr_wizard, "parse_args", lambda: _mk_args(str(config_yaml)))
+    patch_wizard(
+        monkeypatch,
+        mkbrr_wizard,
+        parse_args=lambda: _mk_args(str(config_yaml)),
+        pick_runtime=lambda cfg, forced: "docker",
+        _has_prompt_toolkit=False,
+    )
     # Force docker runtime selection
-    monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "docker")
 
     # simulate minimal user flow: choose inspect then quit
-    seq = _Seq(["2", "/torrentfiles/test.torrent"])
-    monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
+    seq = _seq(["2", "/torrentfiles/test.torrent"])
     monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
     monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", lambda *a, **k: False)
 
     # don't actually invoke docker; patch subprocess.run
-    class Dummy:
-        def __init__(self, returncode=0):
-            self.returncode = returncode
-
-    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", lambda *a, **k: Dummy(0))
+    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run(0))
 
     mkbrr_wizard.main()
@@ -6,6 +6,14 @@ import sys
 from types import ModuleType
 from typing import Any
 
+import prompt_toolkit  # resolved once at import; tests only patch attributes on it
+import pytest  # type: ignore[import-untyped]
+
+# A regular-file stat owned by root (uid/gid 0); built once — os.stat_result
+# is a C type, cheaper than a per-test fake class and shaped exactly like
+# what the production code reads.
+_FAKE_TORRENT_STAT = os.stat_result((0o100644, 0, 0, 1, 0, 0, 0, 0, 0, 0))
+
 
 def test_prompt_toolkit_eof(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None:
     # enable prompt_toolkit branch
@@ -19,13 +27,9 @@ def test_prompt_toolkit_eof(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None:
             raise EOFError()
 
     # Patch PromptSession at the prompt_toolkit top-level
-    import prompt_toolkit
-
     monkeypatch.setattr(prompt_toolkit, "PromptSession", FakeSession, raising=False)
 
     # Ensure raise SystemExit when EOF encountered; pass non-None history to trigger PromptSession branch
-    import pytest
-
     with pytest.raises(SystemExit):
         mkbrr_wizard.ask_path("Prompt", history=mkbrr_wizard._content_history)
 
@@ -68,7 +72,7 @@ def test_render_header_and_docker_run_base(monkeypatch: Any, mkbrr_wizard: Modul
 
 
 def test_maybe_fix_torrent_permissions_permission_error(
-    tmp_path, monkeypatch: Any, mkbrr_wizard: ModuleType
+    tmp_path, monkeypatch: Any, mkbrr_wizard: ModuleType, capsys: pytest.CaptureFixture[str]
 ) -> None:
     cfg = mkbrr_wizard.AppCfg(
         runtime="native",
@@ -91,33 +95,32 @@ def test_maybe_fix_torrent_permissions_permission_error(
     )
 
     os.makedirs(cfg.paths.host_output_dir, exist_ok=True)
-    p = os.path.join(cfg.paths.host_output_dir, "a.torrent")
-    with open(p, "w") as fh:
-        fh.write("x")
 
     monkeypatch.setattr(os, "geteuid", lambda: 0)
 
-    class Stat:
-        st_uid = 0
-        st_gid = 0
-        st_mode = 0o100644
+    # Stat reports root ownership, mismatching the cfg's 1000:1000 so the
+    # per-file chown is attempted.
+    torrent_path = os.path.join(cfg.paths.host_output_dir, "a.torrent")
 
-    orig_stat = os.stat
+    class FakeEntry:
+        path = torrent_path
 
-    def fake_stat(path):
-        if str(path).endswith(".torrent"):
-            return Stat()
-        return orig_stat(path)
+        def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+            return _FAKE_TORRENT_STAT
 
-    monkeypatch.setattr(os, "stat", fake_stat)
+    monkeypatch.setattr(mkbrr_wizard, "_scan_torrent_entries", lambda outdir: [FakeEntry()])
 
-    def fake_chown(path, uid, gid):
-        raise PermissionError("nope")
+    # The no-op probe chown on the output dir succeeds; only the per-file
+    # chown fails, hitting the PermissionError branch in _chown_if_mismatched.
+    def fake_chown(path, uid, gid, *, follow_symlinks=True):
+        if str(path).endswith(".torrent"):
+            raise PermissionError("nope")
 
     monkeypatch.setattr(os, "chown", fake_chown)
 
-    # Should catch PermissionError and not raise
+    # Should catch PermissionError, print a warning, and not raise
     mkbrr_wizard.maybe_fix_torrent_permissions(cfg)
+    assert "Permission error on" in capsys.readouterr().out
 
 
 def test_ask_verbose_and_quiet(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None:
@@ -8,33 +8,41 @@ from typing import Any
 
 import pytest  # type: ignore[import-untyped]
 
+# Resolved once per module instead of per assertion.
+_HOME = Path.home()
+
+
+@pytest.fixture(scope="module")
+def sample_cfg(mkbrr_wizard: ModuleType) -> Any:
+    """Sample config shared by the path-mapping test classes.
+
+    Module-scoped: the mapping functions never mutate their input and the
+    config dataclasses are frozen, so one AppCfg tree serves every test.
+    """
+    return mkbrr_wizard.AppCfg(
+        runtime="auto",
+        docker_support=True,
+        chown=False,
+        docker_user=None,
+        mkbrr=mkbrr_wizard.MkbrrCfg(binary="mkbrr", image="ghcr.io/autobrr/mkbrr"),
+        paths=mkbrr_wizard.PathsCfg(
+            host_data_root="/mnt/user/data",
+            container_data_root="/data",
+            host_output_dir="/mnt/user/data/downloads/torrents/torrentfiles",
+            container_output_dir="/torrentfiles",
+            host_config_dir="/mnt/cache/appdata/mkbrr",
+            container_config_dir="/root/.config/mkbrr",
+        ),
+        ownership=mkbrr_wizard.OwnershipCfg(uid=99, gid=100),
+        batch=mkbrr_wizard.BatchCfg(mode="simple"),
+        presets_yaml_host="/mnt/cache/appdata/mkbrr/presets.yaml",
+        presets_yaml_container="/root/.config/mkbrr/presets.yaml",
+    )
+
 
 class TestMapContentPath:
     """Tests for map_content_path function (config-driven)."""
 
-    @pytest.fixture
-    def sample_cfg(self, mkbrr_wizard: ModuleType) -> Any:
-        """Create a sample config for testing."""
-        return mkbrr_wizard.AppCfg(
-            runtime="auto",
-            docker_support=True,
-            chown=False,
-            docker_user=None,
-            mkbrr=mkbrr_wizard.MkbrrCfg(binary="mkbrr", image="ghcr.io/autobrr/mkbrr"),
-            paths=mkbrr_wizard.PathsCfg(
-                host_data_root="/mnt/user/data",
-                container_data_root="/data",
-                host_output_dir="/mnt/user/data/downloads/torrents/torrentfiles",
-                container_output_dir="/torrentfiles",
-                host_config_dir="/mnt/cache/appdata/mkbrr",
-                container_config_dir="/root/.config/mkbrr",
-            ),
-            ownership=mkbrr_wizard.OwnershipCfg(uid=99, gid=100),
-            batch=mkbrr_wizard.BatchCfg(mode="simple"),
-            presets_yaml_host="/mnt/cache/appdata/mkbrr/presets.yaml",
-            presets_yaml_container="/root/.config/mkbrr/presets.yaml",
-        )
-
     def test_docker_already_container_path(self, mkbrr_wizard: ModuleType, sample_cfg: Any) -> None:
         """Container paths in docker mode should pass through unchanged."""
         assert (
@@ -76,29 +84,6 @@ class TestMapContentPath:
 class TestMapTorrentPath:
     """Tests for map_torrent_path function (config-driven)."""
 
-    @pytest.fixture
-    def sample_cfg(self, mkbrr_wizard: ModuleType) -> Any:
-        """Create a sample config for testing."""
-        return mkbrr_wizard.AppCfg(
-            runtime="auto",
-            docker_support=True,
-            chown=False,
-            docker_user=None,
-            mkbrr=mkbrr_wizard.MkbrrCfg(binary="mkbrr", image="ghcr.io/autobrr/mkbrr"),
-            paths=mkbrr_wizard.PathsCfg(
-                host_data_root="/mnt/user/data",
-                container_data_root="/data",
-                host_output_dir="/mnt/user/data/downloads/torrents/torrentfiles",
-                container_output_dir="/torrentfiles",
-                host_config_dir="/mnt/cache/appdata/mkbrr",
-                container_config_dir="/root/.config/mkbrr",
-            ),
-            ownership=mkbrr_wizard.OwnershipCfg(uid=99, gid=100),
-            batch=mkbrr_wizard.BatchCfg(mode="simple"),
-            presets_yaml_host="/mnt/cache/appdata/mkbrr/presets.yaml",
-            presets_yaml_container="/root/.config/mkbrr/presets.yaml",
-        )
-
     def test_docker_already_container_path(self, mkbrr_wizard: ModuleType, sample_cfg: Any) -> None:
         """Container torrent paths in docker mode should pass through unchanged."""
         assert (
@@ -131,7 +116,7 @@ class TestExpandPath:
     def test_tilde_expansion(self, mkbrr_wizard: ModuleType) -> None:
         """Tilde should expand to home directory."""
         result: str = mkbrr_wizard._expand_path("~/test")
-        assert result == str(Path.home() / "test")
+        assert result == str(_HOME / "test")
 
     def test_env_var_expansion(self, mkbrr_wizard: ModuleType, monkeypatch: Any) -> None:
         """Environment variables should be expanded."""
@@ -164,4 +149,4 @@ class TestCleanUserPath:
     def test_expands_tilde(self, mkbrr_wizard: ModuleType) -> None:
         """Tilde should be expanded after quote stripping."""
         result: str = mkbrr_wizard._clean_user_path("'~/test'")
-        assert result == str(Path.home() / "test")
+        assert result == str(_HOME / "test")
@@ -1,10 +1,13 @@
 """Tests for maybe_fix_torrent_permissions."""
 
 import os
-import tempfile
 from types import ModuleType
 from typing import Any
 
+# Root-owned regular file; a real os.stat_result is cheaper than a fake
+# class and matches the attribute set production code expects.
+_FAKE_TORRENT_STAT = os.stat_result((0o100644, 0, 0, 1, 0, 0, 0, 0, 0, 0))
+
 
 def test_maybe_fix_torrent_permissions_skips_when_not_root(
     mkbrr_wizard: ModuleType, monkeypatch: Any
@@ -36,7 +39,7 @@ def test_maybe_fix_torrent_permissions_skips_when_not_root(
     # monkeypatch chown to capture calls
     called: dict[str, Any] = {"count": 0}
 
-    def fake_chown(p, uid, gid):
+    def fake_chown(p, uid, gid, *, follow_symlinks=True):
         called["count"] += 1
 
     monkeypatch.setattr(os, "chown", fake_chown)
@@ -46,7 +49,7 @@ def test_maybe_fix_torrent_permissions_skips_when_not_root(
 
 
 def test_maybe_fix_torrent_permissions_executes_chown(
-    mkbrr_wizard: ModuleType, monkeypatch: Any
+    tmp_path: Any, mkbrr_wizard: ModuleType, monkeypatch: Any
 ) -> None:
     cfg = mkbrr_wizard.AppCfg(
         runtime="native",
@@ -57,7 +60,7 @@ def test_maybe_fix_torrent_permissions_executes_chown(
         paths=mkbrr_wizard.PathsCfg(
             host_data_root="/mnt/user/data",
             container_data_root="/data",
-            host_output_dir=tempfile.mkdtemp(prefix="mkbrr_test_out_"),
+            host_output_dir=str(tmp_path),
             container_output_dir="/torrentfiles",
             host_config_dir="/mnt/cache/appdata/mkbrr",
             container_config_dir="/root/.config/mkbrr",
@@ -68,48 +71,29 @@ def test_maybe_fix_torrent_permissions_executes_chown(
         presets_yaml_container="/root/.config/mkbrr/presets.yaml",
     )
 
-    # Create a fake .torrent file
-    p = os.path.join(cfg.paths.host_output_dir, "test.torrent")
-    with open(p, "w") as fh:
-        fh.write("fake")
-
-    # file has different uid/gid; ensure we run chown path
     monkeypatch.setattr(os, "geteuid", lambda: 0)
 
-    class Stat:
-        st_uid = 0
-        st_gid = 0
-        st_mode = 0
+    # os.stat/os.chown are faked, so no real .torrent file is needed —
+    # stub the directory scan instead of creating and cleaning one up.
+    torrent_path = str(tmp_path / "test.torrent")
 
-    orig_stat = os.stat
+    class FakeEntry:
+        path = torrent_path
 
-    def fake_stat(fd):
-        # Only return the fake Stat for our .torrent file
-        if str(fd).endswith("test.torrent"):
-            s = Stat()
-            s.st_mode = 0o100644
-            return s
-        return orig_stat(fd)
+        def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+            return _FAKE_TORRENT_STAT
+
+    monkeypatch.setattr(mkbrr_wizard, "_scan_torrent_entries", lambda outdir: [FakeEntry()])
 
-    monkeypatch.setattr(os, "stat", fake_stat)
     called: dict[str, Any] = {"count": 0, "args": []}
 
-    def fake_chown(path, uid, gid):
+    def fake_chown(path, uid, gid, *, follow_symlinks=True):
         called["count"] += 1
         called["args"].append((path, uid, gid))
 
     monkeypatch.setattr(os, "chown", fake_chown)
 
     mkbrr_wizard.maybe_fix_torrent_permissions(cfg)
-    # chown should have been invoked once
+    # chown should have been invoked for the (fake) mismatched torrent
     assert called["count"] >= 1
-
-    # cleanup
-    try:
-        os.unlink(p)
-    except Exception:
-        pass
-    try:
-        os.rmdir(cfg.paths.host_output_dir)
-    except Exception:
-        pass
+    assert (torrent_path, 999999, 999999) in called["args"]
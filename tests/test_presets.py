@@ -2,23 +2,16 @@
 
 from __future__ import annotations
 
-import os
-import tempfile
-from types import ModuleType
+from typing import TYPE_CHECKING
 
+import pytest  # type: ignore[import-untyped]
 
-class TestLoadPresets:
-    """Tests for load_presets function."""
-
-    def test_missing_file_returns_fallback(self, mkbrr_wizard: ModuleType) -> None:
-        """Missing file should return fallback presets."""
-        result: list[str] = mkbrr_wizard.load_presets("/nonexistent/path/presets.yaml")
-
-        assert result == ["btn", "custom"]
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
 
-    def test_valid_presets_file(self, mkbrr_wizard: ModuleType) -> None:
-        """Valid presets file should return preset names."""
-        yaml_content = """
+# Pre-encoded so the fixture can write_bytes without a per-run encode step.
+_VALID_PRESETS_YAML = b"""
 presets:
   btn:
     announce: https://example.com/announce
@@ -29,24 +22,11 @@ presets:
   red:
     announce: https://example3.com/announce
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            result = mkbrr_wizard.load_presets(temp_path)
-
-            # btn should be first
-            assert result[0] == "btn"
-            assert "mam" in result
-            assert "red" in result
-            assert len(result) == 3
-        finally:
-            os.unlink(temp_path)
 
-    def test_btn_is_prioritized(self, mkbrr_wizard: ModuleType) -> None:
-        """btn preset should be moved to first position."""
-        yaml_content = """
+# (yaml_text, expected) cases for _parse_presets_text, built once at import.
+_PARSE_CASES = [
+    pytest.param(
+        """
 presets:
   mam:
     announce: https://example.com/announce
@@ -54,47 +34,52 @@ presets:
     announce: https://example2.com/announce
   red:
     announce: https://example3.com/announce
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+""",
+        ["btn", "mam", "red"],
+        id="btn-prioritized",
+    ),
+    pytest.param("presets:\n", ["btn", "custom"], id="empty-presets"),
+    pytest.param(
+        """
+other_stuff:
+  key: value
+""",
+        ["btn", "custom"],
+        id="no-presets-key",
+    ),
+]
 
-        try:
-            result = mkbrr_wizard.load_presets(temp_path)
 
-            # btn should be moved to first position
-            assert result[0] == "btn"
-            assert result == ["btn", "mam", "red"]
-        finally:
-            os.unlink(temp_path)
+@pytest.fixture(scope="session")
+def preset_yaml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A valid presets.yaml written once and shared by all file-based tests."""
+    p = tmp_path_factory.mktemp("presets") / "presets.yaml"
+    p.write_bytes(_VALID_PRESETS_YAML)
+    return p
 
-    def test_empty_presets_returns_fallback(self, mkbrr_wizard: ModuleType) -> None:
-        """Empty presets section should return fallback."""
-        yaml_content = """
-presets:
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
 
-        try:
-            result = mkbrr_wizard.load_presets(temp_path)
-            assert result == ["btn", "custom"]
-        finally:
-            os.unlink(temp_path)
+class TestLoadPresets:
+    """Tests for load_presets and the _parse_presets_text helper it delegates to."""
 
-    def test_no_presets_key_returns_fallback(self, mkbrr_wizard: ModuleType) -> None:
-        """YAML without presets key should return fallback."""
-        yaml_content = """
-other_stuff:
-  key: value
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+    def test_missing_file_returns_fallback(self, mkbrr_wizard: ModuleType) -> None:
+        """Missing file should return fallback presets."""
+        result: list[str] = mkbrr_wizard.load_presets("/nonexistent/path/presets.yaml")
 
-        try:
-            result = mkbrr_wizard.load_presets(temp_path)
-            assert result == ["btn", "custom"]
-        finally:
-            os.unlink(temp_path)
+        assert result == ["btn", "custom"]
+
+    def test_valid_presets_file(self, mkbrr_wizard: ModuleType, preset_yaml_file: Path) -> None:
+        """Valid presets file should return preset names."""
+        result = mkbrr_wizard.load_presets(str(preset_yaml_file))
+
+        # btn should be first
+        assert result[0] == "btn"
+        assert "mam" in result
+        assert "red" in result
+        assert len(result) == 3
+
+    @pytest.mark.parametrize("yaml_text,expected", _PARSE_CASES)
+    def test_parse_presets_text(
+        self, yaml_text: str, expected: list[str], mkbrr_wizard: ModuleType
+    ) -> None:
+        """btn is prioritized; missing/empty presets fall back to defaults."""
+        assert mkbrr_wizard._parse_presets_text(yaml_text) == expected
@@ -5,7 +5,7 @@ from typing import Any
 
 import pytest  # type: ignore[import-untyped]
 
-from .conftest import _Seq
+from .conftest import FakeProc, _seq
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -337,7 +337,7 @@ presets_yaml: {presets_yaml}
         # str(season_dir) -> content path
         # "1-6, 7-12" -> split ranges
         # "q" -> choose_action quit (split uses continue, skips do-another)
-        seq = _Seq(
+        seq = _seq(
             [
                 "1",  # create
                 "1",  # preset
@@ -351,20 +351,16 @@ presets_yaml: {presets_yaml}
         # True -> "Split this season into parts?"
         # True -> confirm command preview
         # False -> "Do another operation?" after split completes
-        cseq = _Seq([True, True, False])
+        cseq = _seq([True, True, False])
         monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", cseq)
 
         # Track commands that were executed
         executed_cmds: list[list[str]] = []
 
-        class Dummy:
-            def __init__(self, returncode=0):
-                self.returncode = returncode
-
         def fake_run(*args, **kwargs):
             cmd = args[0] if args else kwargs.get("cmd", [])
             executed_cmds.append(list(cmd))
-            return Dummy(0)
+            return FakeProc(0)
 
         monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run)
 
@@ -445,7 +441,7 @@ presets_yaml: {presets_yaml}
         monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
         monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
 
-        seq = _Seq(
+        seq = _seq(
             [
                 "1",  # create
                 "1",  # preset
@@ -456,18 +452,15 @@ presets_yaml: {presets_yaml}
         monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
 
         # split? yes, confirm preview yes, do another? no
-        cseq = _Seq([True, True, False])
+        cseq = _seq([True, True, False])
         monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", cseq)
 
         executed_cmds: list[list[str]] = []
 
-        class Dummy:
-            returncode = 0
-
         def fake_run(*args, **kwargs):
             cmd = args[0] if args else kwargs.get("cmd", [])
             executed_cmds.append(list(cmd))
-            return Dummy()
+            return FakeProc(0)
 
         monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run)
 
@@ -523,7 +516,7 @@ presets_yaml: {presets_yaml}
         monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
         monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
 
-        seq = _Seq(
+        seq = _seq(
             [
                 "1",  # create
                 "1",  # preset
@@ -533,18 +526,15 @@ presets_yaml: {presets_yaml}
         monkeypatch.setattr(mkbrr_wizard.Prompt, "ask", seq)
 
         # Confirm.ask: decline split, confirm create, decline another
-        cseq = _Seq([False, True, False])
+        cseq = _seq([False, True, False])
         monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", cseq)
 
         executed_cmds: list[list[str]] = []
 
-        class Dummy:
-            returncode = 0
-
         def fake_run(*args, **kwargs):
             cmd = args[0] if args else kwargs.get("cmd", [])
             executed_cmds.append(list(cmd))
-            return Dummy()
+            return FakeProc(0)
 
         monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run)
 
@@ -591,7 +581,7 @@ presets_yaml: {presets_yaml}
         monkeypatch.setattr(mkbrr_wizard, "pick_runtime", lambda cfg, forced: "native")
         monkeypatch.setattr(mkbrr_wizard, "_has_prompt_toolkit", False)
 
-        seq = _Seq(
+        seq = _seq(
             [
                 "1",  # create
                 "1",  # preset
@@ -602,18 +592,15 @@ presets_yaml: {presets_yaml}
 
         # Confirm: create confirm, do-another -> no
         # (no split question since no episodes detected)
-        cseq = _Seq([True, False])
+        cseq = _seq([True, False])
         monkeypatch.setattr(mkbrr_wizard.Confirm, "ask", cseq)
 
         executed_cmds: list[list[str]] = []
 
-        class Dummy:
-            returncode = 0
-
         def fake_run(*args, **kwargs):
             cmd = args[0] if args else kwargs.get("cmd", [])
             executed_cmds.append(list(cmd))
-            return Dummy()
+            return FakeProc(0)
 
         monkeypatch.setattr(mkbrr_wizard.subprocess, "run", fake_run)
 
@@ -5,29 +5,31 @@ from typing import Any
 
 
 def test_docker_available_true(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None:
-    class Dummy:
-        returncode = 0
-
-    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", lambda *a, **k: Dummy())
+    mkbrr_wizard.docker_available.cache_clear()
+    monkeypatch.setattr(mkbrr_wizard, "_probe_docker", lambda: True)
     assert mkbrr_wizard.docker_available() is True
+    mkbrr_wizard.docker_available.cache_clear()
 
 
 def test_docker_available_false(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None:
-    class Dummy:
-        returncode = 1
-
-    monkeypatch.setattr(mkbrr_wizard.subprocess, "run", lambda *a, **k: Dummy())
+    mkbrr_wizard.docker_available.cache_clear()
+    monkeypatch.setattr(mkbrr_wizard, "_probe_docker", lambda: False)
     assert mkbrr_wizard.docker_available() is False
+    mkbrr_wizard.docker_available.cache_clear()
 
 
 def test_native_available_true(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None:
-    monkeypatch.setattr(mkbrr_wizard.shutil, "which", lambda bin: "/usr/local/bin/mkbrr")
+    mkbrr_wizard._which_cached.cache_clear()
+    monkeypatch.setattr(mkbrr_wizard.shutil, "which", lambda bin, path=None: "/usr/local/bin/mkbrr")
     assert mkbrr_wizard.native_available("mkbrr") is True
+    mkbrr_wizard._which_cached.cache_clear()
 
 
 def test_native_available_false(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None:
-    monkeypatch.setattr(mkbrr_wizard.shutil, "which", lambda bin: None)
+    mkbrr_wizard._which_cached.cache_clear()
+    monkeypatch.setattr(mkbrr_wizard.shutil, "which", lambda bin, path=None: None)
     assert mkbrr_wizard.native_available("mkbrr") is False
+    mkbrr_wizard._which_cached.cache_clear()
 
 
 def test_confirm_cmd_with_cwd(monkeypatch: Any, mkbrr_wizard: ModuleType) -> None: